@@ -10,7 +10,8 @@ module: dev_write_module
 short_description: Create/overwrite a text file with given content (idempotent)
 version_added: "1.0.0"
 description:
-  - Creates a text file at the given path with the provided content.
+  - Creates a text file at the given path with the provided content,
+    or a copy of another file on the target host.
   - If the file already exists with identical content, nothing changes.
   - Supports check mode and returns a diff.
 options:
@@ -19,9 +20,19 @@ options:
     type: path
     required: true
   content:
-    description: Text content to write into the file (UTF-8).
+    description:
+      - Text content to write into the file (UTF-8).
+      - Mutually exclusive with O(src_path); one of them is required.
     type: str
-    required: true
+  src_path:
+    description:
+      - Path of a file on the target host whose bytes are copied to O(path).
+      - The copy is done in the kernel with C(os.sendfile).
+    type: path
+  durable:
+    description: Call fsync on the written file before it replaces the target.
+    type: bool
+    default: false
 author:
   - "Laura Grechenko (@lauragrechenko)"
 '''
@@ -31,6 +42,11 @@ EXAMPLES = r'''
   dev_write_module:
     path: /tmp/hello.txt
     content: "Hello, ansible-world!"
+
+- name: Copy an existing file on the host
+  dev_write_module:
+    path: /tmp/hello-copy.txt
+    src_path: /tmp/hello.txt
 '''
 
 RETURN = r'''
@@ -48,36 +64,143 @@ changed:
   returned: always
 '''
 
+import functools
 import os
+import shutil
+import tempfile
 from ansible.module_utils.basic import AnsibleModule
 
+CHUNK_SIZE = 64 * 1024
+
+
+def _differs(fd: int, new_bytes: bytes) -> bool:
+    """Compare the open file with new_bytes chunk by chunk; stop at first mismatch."""
+    off = 0
+    while off < len(new_bytes):
+        buf = os.read(fd, CHUNK_SIZE)
+        if not buf or buf != new_bytes[off:off + len(buf)]:
+            return True
+        off += len(buf)
+    return False
+
+
+def _files_differ(fd: int, src_fd: int) -> bool:
+    """Compare two open files chunk by chunk; stop at first mismatch."""
+    while True:
+        buf = os.read(fd, CHUNK_SIZE)
+        if buf != os.read(src_fd, CHUNK_SIZE):
+            return True
+        if not buf:
+            return False
+
+
+def _write_bytes(fd: int, new_bytes: bytes) -> None:
+    mv = memoryview(new_bytes)
+    while mv:
+        n = os.write(fd, mv)
+        mv = mv[n:]
+
+
+def _sendfile_from(fd: int, src_path: str) -> None:
+    """Copy src_path into fd in the kernel; fall back to a userspace copy where unsupported."""
+    src_fd = os.open(src_path, os.O_RDONLY)
+    try:
+        size = os.fstat(src_fd).st_size
+        sent = 0
+        while sent < size:
+            try:
+                n = os.sendfile(fd, src_fd, sent, size - sent)
+            except (OSError, AttributeError):
+                # file-to-file sendfile is Linux-only (ENOTSOCK on macOS/BSD)
+                if sent:
+                    raise
+                with open(src_fd, 'rb', closefd=False) as src, open(fd, 'wb', closefd=False) as dst:
+                    shutil.copyfileobj(src, dst)
+                return
+            if n == 0:
+                raise OSError(f"'{src_path}' shrank while copying ({sent} of {size} bytes)")
+            sent += n
+    finally:
+        os.close(src_fd)
+
+
+def _write_atomic(module: AnsibleModule, path: str, write, durable: bool = False) -> None:
+    """Fill a temp file next to the target via write(fd), then atomic_move it over path."""
+    # write through symlinks like open() did; atomic_move keeps mode, owner and SELinux context
+    path = os.path.realpath(path)
+    # mkstemp uses O_EXCL with a random name, so a planted symlink can't redirect the write
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        try:
+            write(fd)
+            if durable:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        module.atomic_move(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 def run_module():
     module = AnsibleModule(
         argument_spec=dict(
             path=dict(type='path', required=True),
-            content=dict(type='str', required=True),
+            content=dict(type='str'),
+            src_path=dict(type='path'),
+            durable=dict(type='bool', default=False),
         ),
+        mutually_exclusive=[('content', 'src_path')],
+        required_one_of=[('content', 'src_path')],
         supports_check_mode=True,
     )
 
     path = module.params['path']
+    src_path = module.params['src_path']
     new_content = module.params['content']
-
-    current_content = None
-    if os.path.exists(path):
+    new_bytes = None
+    if src_path is not None:
         try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                current_content = f.read()
-        except Exception as e:
+            size = os.stat(src_path).st_size
+        except OSError as e:
+            module.fail_json(msg=f"Failed to read '{src_path}': {e}")
+    else:
+        new_bytes = new_content.encode('utf-8')
+        size = len(new_bytes)
+
+    content_changed = True
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        fd = None
+    except OSError as e:
+        module.fail_json(msg=f"Failed to read '{path}': {e}")
+
+    if fd is not None:
+        try:
+            st = os.fstat(fd)
+            if new_bytes is None:
+                if st.st_size == size:
+                    src_fd = os.open(src_path, os.O_RDONLY)
+                    try:
+                        content_changed = _files_differ(fd, src_fd)
+                    finally:
+                        os.close(src_fd)
+            elif st.st_size == len(new_bytes):
+                content_changed = _differs(fd, new_bytes)
+        except OSError as e:
             module.fail_json(msg=f"Failed to read '{path}': {e}")
-
-    content_changed = (current_content != new_content)
+        finally:
+            os.close(fd)
 
     result = {
         'changed': content_changed,
         'path': path,
-        'size': len(new_content),
+        'size': size,
     }
 
     if module.check_mode:
@@ -86,13 +209,18 @@ def run_module():
     if content_changed:
         try:
             parent = os.path.dirname(path)
-            if parent and not os.path.isdir(parent):
+            if parent:
                 os.makedirs(parent, exist_ok=True)
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            if new_bytes is None:
+                write = functools.partial(_sendfile_from, src_path=src_path)
+            else:
+                write = functools.partial(_write_bytes, new_bytes=new_bytes)
+            _write_atomic(module, path, write, module.params['durable'])
         except Exception as e:
             module.fail_json(msg=f"Failed to write '{path}': {e}", **result)
 
+    # the encoded copy is no longer needed while exit_json serializes the result
+    del new_bytes
     module.exit_json(**result)
 
 
@@ -18,6 +18,7 @@ description:
     preemptible VM flag, NAT/public IP and SSH key injection.
 requirements:
   - yc CLI configured on control host
+  - orjson (optional) for faster parsing of yc JSON output
 options:
   state:
     description: Desired state of the instance.
@@ -25,9 +26,18 @@ options:
     choices: [present]
     default: present
   name:
-    description: Instance name.
+    description:
+      - Instance name.
+      - Mutually exclusive with O(names); one of them is required.
     type: str
-    required: true
+  names:
+    description:
+      - List of instance names to ensure in one run.
+      - The folder is listed once and missing instances are created in parallel,
+        bounded by the C(YC_PARALLEL) environment variable (default 8).
+      - All instances share the remaining options.
+    type: list
+    elements: str
   folder_id:
     description: Folder ID that contains the instance.
     type: str
@@ -70,6 +80,7 @@ options:
   core_fraction:
     description: Guaranteed vCPU performance (percent, YC allowed values are typically 5, 20, 50, 100).
     type: int
+    choices: [5, 20, 50, 100]
     default: 5
   preemptible:
     description: Create preemptible instance.
@@ -106,6 +117,14 @@ EXAMPLES = r'''
     preemptible: false
     nat: true
     ssh_key: "{{ lookup('file', '~/.ssh/id_rsa.pub') }}"
+
+- name: Ensure several instances present in one task
+  netology_devops.learning.yc_instance:
+    names: [web-1, web-2, web-3]
+    folder_id: "{{ yc_folder_id }}"
+    zone: ru-central1-a
+    subnet_id: "{{ yc_subnet_id }}"
+    image_id: "{{ yc_image_id }}"
 '''
 
 RETURN = r'''
@@ -129,45 +148,78 @@ public_ip:
   description: Public IPv4 address (if NAT was enabled and IP assigned).
   type: str
   returned: when available
+results:
+  description: Per-instance C(changed), C(instance_id), C(name), C(status) and C(public_ip).
+  type: list
+  elements: dict
+  returned: when O(names) is used
+failures:
+  description: Error message per instance name that could not be created.
+  type: dict
+  returned: when O(names) is used and some creates failed
 '''
 
 import json
+import os
+import re
 import shlex
 import shutil
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from ansible.module_utils.basic import AnsibleModule
 
+try:
+    from orjson import loads as _jloads
+except ImportError:
+    from json import loads as _jloads
 
-def _run(cmd: list[str]) -> str:
-    """Run a command, raise on non-zero; return stdout."""
-    try:
-        p = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=True,
-        )
-        return p.stdout
-    except subprocess.CalledProcessError as e:
-        msg = e.stderr.strip() or e.stdout.strip() or f"Command failed: {' '.join(shlex.quote(c) for c in cmd)}"
-        raise RuntimeError(msg) from e
+# resolved once per process; main() fails early when yc is missing
+_YC_BIN = shutil.which("yc")
 
+_FINAL_STATUSES = ("RUNNING", "STOPPED", "ERROR")
 
-def _list_instances(folder_id: str) -> list[dict]:
-    out = _run(["yc", "compute", "instance", "list", "--folder-id", folder_id, "--format", "json"])
+# (param, minimum) pairs checked by _validate_positive
+_MIN_BOUNDS = (("cores", 1), ("memory_gb", 1), ("disk_gb", 1))
+
+
+def _run(module: AnsibleModule | None, cmd: list[str]) -> bytes:
+    """Run a command, raise on non-zero; return raw stdout."""
+    # worker threads pass module=None: run_command forks with a preexec_fn and
+    # may call fail_json itself, neither of which is safe off the main thread
+    if module is None:
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        rc, out, err = proc.returncode, proc.stdout, proc.stderr
+    else:
+        rc, out, err = module.run_command(cmd, check_rc=False, use_unsafe_shell=False, encoding=None)
+    if rc:
+        msg = (err.strip() or out.strip()).decode("utf-8", "replace")
+        raise RuntimeError(msg or f"Command failed: {' '.join(shlex.quote(c) for c in cmd)}")
+    return out
+
+
+def _list_instances(module: AnsibleModule, folder_id: str) -> list[dict]:
+    out = _run(module, [_YC_BIN, "compute", "instance", "list", "--folder-id", folder_id, "--format", "json"])
     try:
-        return json.loads(out or "[]")
+        return _jloads(out or b"[]")
     except json.JSONDecodeError as e:
         raise RuntimeError(f"Failed to parse yc list output: {e}") from e
 
 
-def _get_instance_by_name(name: str, folder_id: str) -> dict | None:
-    for inst in _list_instances(folder_id):
-        if inst.get("name") == name:
-            return inst
-    return None
+def _get_instance_direct(module: AnsibleModule | None, name: str, folder_id: str) -> dict | None:
+    """Look up a single instance by name server-side; return None if it does not exist."""
+    try:
+        out = _run(module, [_YC_BIN, "compute", "instance", "get", "--name", name,
+                            "--folder-id", folder_id, "--format", "json"])
+    except RuntimeError as e:
+        # only the instance lookup itself; a missing folder/profile must still fail
+        if re.search(rf'instance with name (?:or id )?["\']?{re.escape(name)}["\']? not found', str(e), re.I):
+            return None
+        raise
+    try:
+        return _jloads(out or b"null")
+    except json.JSONDecodeError as e:
+        raise RuntimeError(f"Failed to parse yc get output: {e}") from e
 
 
 def _extract_public_ip(inst: dict) -> str | None:
@@ -182,21 +234,126 @@ def _extract_public_ip(inst: dict) -> str | None:
         return None
 
 
-def _poll_status(name: str, folder_id: str, timeout_s: int = 90) -> dict | None:
-    start = time.time()
-    while time.time() - start < timeout_s:
-        inst = _get_instance_by_name(name, folder_id)
-        if inst and inst.get("status"):
+def _poll_status(module: AnsibleModule | None, name: str, folder_id: str, timeout_s: int = 90) -> dict | None:
+    """Poll with exponential backoff (0.5s doubling up to 8s) until a final status."""
+    delay = 0.5
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        inst = _get_instance_direct(module, name, folder_id)
+        if inst and inst.get("status") in _FINAL_STATUSES:
             return inst
-        time.sleep(2)
-    return _get_instance_by_name(name, folder_id)
+        time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+        delay = min(delay * 2, 8.0)
+    return _get_instance_direct(module, name, folder_id)
+
+
+def _validate_positive(module: AnsibleModule, p: dict) -> None:
+    for key, minimum in _MIN_BOUNDS:
+        if p[key] < minimum:
+            module.fail_json(msg=f"{key} must be >= {minimum}")
+
+
+def _build_create_cmd(p: dict, name: str) -> list[str]:
+    boot_disk = f"size={p['disk_gb']}GB,type={p['disk_type']},image-id={p['image_id']}"
+    # network + NAT/public IP
+    nic = ",".join(["subnet-id=" + p["subnet_id"]] + (["nat-ip-version=ipv4"] if p["nat"] else []))
+    return [
+        _YC_BIN, "compute", "instance", "create",
+        "--name", name,
+        "--folder-id", p["folder_id"],
+        "--zone", p["zone"],
+        "--create-boot-disk", boot_disk,
+        "--cores", str(p["cores"]),
+        "--memory", str(p["memory_gb"]),
+        "--core-fraction", str(p["core_fraction"]),
+        "--platform-id", p["platform_id"],
+        "--format", "json",
+        "--preemptible" if p["preemptible"] else "--non-preemptible",
+        "--network-interface", nic,
+        *(("--ssh-key", p["ssh_key"]) if p.get("ssh_key") else ()),
+    ]
+
+
+def _instance_result(name: str, inst: dict | None, changed: bool) -> dict:
+    return dict(
+        changed=changed,
+        instance_id=inst.get("id") if inst else None,
+        name=name,
+        status=inst.get("status") if inst else None,
+        public_ip=_extract_public_ip(inst) if inst else None,
+    )
+
+
+def _create_one(module: AnsibleModule | None, p: dict, name: str) -> dict:
+    out = _run(module, _build_create_cmd(p, name))
+    try:
+        created = _jloads(out or b"{}")
+    except json.JSONDecodeError:
+        created = {}
+
+    # yc waits for the create operation and prints the instance record;
+    # poll only if it came back without status/network details
+    if created.get("status") and created.get("network_interfaces"):
+        inst = created
+    else:
+        inst = _poll_status(module, name, p["folder_id"], timeout_s=90)
+
+    return _instance_result(name, inst, changed=True)
+
+
+def _parallelism(module: AnsibleModule) -> int:
+    raw = os.environ.get("YC_PARALLEL", "8")
+    try:
+        workers = int(raw)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        module.fail_json(msg=f"YC_PARALLEL must be a positive integer, got {raw!r}")
+    return workers
+
+
+def _ensure_many(module: AnsibleModule, p: dict) -> None:
+    workers = _parallelism(module)
+    names = list(dict.fromkeys(p["names"]))
+    existing = {inst.get("name"): inst for inst in _list_instances(module, p["folder_id"])}
+    missing = [n for n in names if n not in existing]
+
+    if module.check_mode or not missing:
+        module.exit_json(
+            changed=bool(missing),
+            results=[_instance_result(n, existing.get(n), changed=n not in existing) for n in names],
+        )
+
+    created = {}
+    failures = {}
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = {n: ex.submit(_create_one, None, p, n) for n in missing}
+        for n, f in futures.items():
+            try:
+                created[n] = f.result()
+            except (RuntimeError, OSError, json.JSONDecodeError) as e:
+                failures[n] = str(e)
+
+    results = [created[n] if n in created else _instance_result(n, existing[n], changed=False)
+               for n in names if n not in failures]
+
+    if failures:
+        module.fail_json(
+            msg="Failed to create: " + "; ".join(f"{n}: {err}" for n, err in failures.items()),
+            changed=bool(created),
+            results=results,
+            failures=failures,
+        )
+
+    module.exit_json(changed=True, results=results)
 
 
 def main():
     module = AnsibleModule(
         argument_spec=dict(
             state=dict(type="str", choices=["present"], default="present"),
-            name=dict(type="str", required=True),
+            name=dict(type="str"),
+            names=dict(type="list", elements="str"),
             folder_id=dict(type="str", required=True),
             zone=dict(type="str", required=True),
             subnet_id=dict(type="str", required=True),
@@ -211,30 +368,28 @@ def main():
             disk_type=dict(type="str",
                            choices=["network-hdd", "network-ssd", "network-ssd-nonreplicated"],
                            default="network-hdd"),
-            core_fraction=dict(type="int", default=5),
+            core_fraction=dict(type="int", choices=[5, 20, 50, 100], default=5),
             preemptible=dict(type="bool", default=True),
             nat=dict(type="bool", default=True),
             ssh_key=dict(type="str", required=False, no_log=True),
         ),
+        mutually_exclusive=[("name", "names")],
+        required_one_of=[("name", "names")],
         supports_check_mode=True,
     )
 
     p = module.params
 
-    if not shutil.which("yc"):
+    if _YC_BIN is None:
         module.fail_json(msg="yc CLI not found in PATH. Install it and run `yc init` (or set SA env) first.")
 
-    if p["cores"] < 1:
-        module.fail_json(msg="cores must be >= 1")
-    if p["memory_gb"] < 1:
-        module.fail_json(msg="memory_gb must be >= 1")
-    if p["disk_gb"] < 1:
-        module.fail_json(msg="disk_gb must be >= 1")
-    if p["core_fraction"] not in (5, 20, 50, 100):
-        module.fail_json(msg="core_fraction must be one of 5, 20, 50, 100")
+    _validate_positive(module, p)
 
     try:
-        inst = _get_instance_by_name(p["name"], p["folder_id"])
+        if p["names"] is not None:
+            _ensure_many(module, p)
+
+        inst = _get_instance_direct(module, p["name"], p["folder_id"])
 
         if inst is not None:
             module.exit_json(
@@ -248,60 +403,12 @@ def main():
         if module.check_mode:
             module.exit_json(changed=True)
 
-        boot_disk = f"size={p['disk_gb']}GB,type={p['disk_type']},image-id={p['image_id']}"
-        create_cmd = [
-            "yc", "compute", "instance", "create",
-            "--name", p["name"],
-            "--folder-id", p["folder_id"],
-            "--zone", p["zone"],
-            "--create-boot-disk", boot_disk,
-            "--cores", str(p["cores"]),
-            "--memory", str(p["memory_gb"]),
-            "--core-fraction", str(p["core_fraction"]),
-            "--platform-id", p["platform_id"],
-            "--format", "json",
-        ]
-
-        create_cmd.append("--preemptible" if p["preemptible"] else "--non-preemptible")
-
-        # network + NAT/public IP
-        nic = f"subnet-id={p['subnet_id']}"
-        if p["nat"]:
-            nic += ",nat-ip-version=ipv4"
-        create_cmd += ["--network-interface", nic]
-
-        # ssh key
-        if p.get("ssh_key"):
-            create_cmd += ["--ssh-key", p["ssh_key"]]
-
-        out = _run(create_cmd)
-        try:
-            created = json.loads(out or "{}")
-        except json.JSONDecodeError:
-            created = {}
-
-        # brief poll so we can return status/ip
-        inst = _poll_status(p["name"], p["folder_id"], timeout_s=90)
-
-        # module.exit_json(
-        #     changed=True,
-        #     instance_id=created.get("id"),
-        #     name=p["name"],
-        #     status=created.get("status"),
-        # )
-
-        module.exit_json(
-            changed=True,
-            instance_id=inst.get("id") if inst else None,
-            name=p["name"],
-            status=inst.get("status") if inst else None,
-            public_ip=_extract_public_ip(inst) if inst else None,
-        )
+        module.exit_json(**_create_one(module, p, p["name"]))
 
     except RuntimeError as e:
         module.fail_json(msg=str(e))
-    except Exception as e:
-        module.fail_json(msg=f"Unexpected error: {e!r}")
+    except (OSError, json.JSONDecodeError) as e:
+        module.fail_json(msg=f"Unexpected error: {e}")
 
 
 if __name__ == "__main__":